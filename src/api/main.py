@@ -1,13 +1,16 @@
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 from queue import Queue, Empty
 import threading
 import logging
 import atexit
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 import sys
 import os
+import gzip
+import orjson
+import zstandard
 
 # Add parent directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -57,6 +60,47 @@ db_path = os.path.join(project_root, config["db_path"])
 db_manager = DatabaseManager(db_path)
 shutdown_event = threading.Event()
 
+# Payloads smaller than this are sent uncompressed
+MIN_COMPRESS_SIZE = 500
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick zstd or gzip by the client's Accept-Encoding q-values, preferring zstd on ties"""
+    qvalues = {}
+    for token in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in token.split(";")]
+        coding = coding.lower()
+        if coding not in ("zstd", "gzip"):
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+
+    best = max(("zstd", "gzip"), key=lambda coding: qvalues.get(coding, 0.0))
+    return best if qvalues.get(best, 0.0) > 0 else None
+
+def fast_json_response(request: Request, payload) -> Response:
+    """Serialize with orjson, skipping response_model validation, and compress per Accept-Encoding"""
+    body = orjson.dumps(payload)
+    headers = {"Vary": "Accept-Encoding"}
+
+    if len(body) >= MIN_COMPRESS_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+        if encoding == "zstd":
+            # ZstdCompressor is not thread-safe and sync routes run in a threadpool
+            body = zstandard.ZstdCompressor(level=3).compress(body)
+            headers["Content-Encoding"] = "zstd"
+        elif encoding == "gzip":
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
 class Metric(BaseModel):
     scid: str = Field(..., description="Spacecraft ID")
     time: str = Field(..., description="Timestamp in ISO format")
@@ -75,6 +119,16 @@ class Metric(BaseModel):
             }
         }
 
+class MetricSeries(BaseModel):
+    scid: str = Field(..., description="Spacecraft ID")
+    metric: str = Field(..., description="Metric name")
+    threshold: float = Field(..., description="Threshold value")
+    time: List[str] = Field(..., description="Timestamps in ISO format, newest first")
+    value: List[float] = Field(..., description="Metric values, parallel to time")
+
+class MetricSeriesResponse(BaseModel):
+    series: List[MetricSeries] = Field(..., description="One entry per scid/metric/threshold")
+
 @app.post("/log_metric", response_model=dict)
 async def log_metric(data: Metric):
     try:
@@ -94,17 +148,29 @@ async def log_metric(data: Metric):
         logger.error(f"Error queueing metric: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@app.get("/metrics", response_model=List[Metric])
+@app.get("/metrics", responses={
+    200: {
+        "model": Union[List[Metric], MetricSeriesResponse],
+        "description": "List of metrics for format=rows, or a series object for format=columnar"
+    }
+})
 def get_metrics(
+    request: Request,
     metric: Optional[str] = Query(None, description="Filter by metric name"),
     scid: Optional[str] = Query(None, description="Filter by spacecraft ID"),
-    limit: int = Query(30, ge=1, le=500, description="Number of records to return")
+    limit: int = Query(30, ge=1, le=500, description="Number of records to return"),
+    fmt: str = Query("rows", alias="format", pattern="^(rows|columnar)$", description="'rows' for one object per metric, 'columnar' for parallel time/value arrays per series")
 ):
     try:
-        logger.info(f"Retrieving metrics: SCID={scid}, Metric={metric}, Limit={limit}")
+        logger.info(f"Retrieving metrics: SCID={scid}, Metric={metric}, Limit={limit}, Format={fmt}")
+        if fmt == "columnar":
+            series = db_manager.get_metric_series(scid=scid, metric=metric, limit=limit)
+            logger.info(f"Retrieved {sum(len(s['time']) for s in series)} metrics in {len(series)} series")
+            return fast_json_response(request, {"series": series})
+
         metrics = db_manager.get_metrics(scid=scid, metric=metric, limit=limit)
         logger.info(f"Retrieved {len(metrics)} metrics")
-        return metrics
+        return fast_json_response(request, metrics)
     except Exception as e:
         logger.error(f"Error retrieving metrics: {e}")
         raise HTTPException(status_code=500, detail="Error retrieving metrics")
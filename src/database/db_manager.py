@@ -115,18 +115,19 @@ class DatabaseManager:
         finally:
             conn.close()
 
-    def get_metrics(
+    def _query_metrics(
         self,
+        columns: str,
         scid: Optional[str] = None,
         metric: Optional[str] = None,
         limit: int = 10
-    ) -> List[Dict[str, Any]]:
-        """Retrieve metrics with optional filtering"""
+    ) -> List[tuple]:
+        """Run a filtered, time-descending, limited SELECT over the metrics table"""
+        conn = self.get_connection()
         try:
-            conn = self.get_connection()
             cursor = conn.cursor()
             
-            query = "SELECT scid, time, metric, value, threshold FROM metrics"
+            query = f"SELECT {columns} FROM metrics"
             params = []
             
             conditions = []
@@ -144,7 +145,22 @@ class DatabaseManager:
             params.append(limit)
             
             cursor.execute(query, params)
-            rows = cursor.fetchall()
+            return cursor.fetchall()
+        finally:
+            conn.close()
+
+    def get_metrics(
+        self,
+        scid: Optional[str] = None,
+        metric: Optional[str] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Retrieve metrics with optional filtering"""
+        try:
+            rows = self._query_metrics(
+                "scid, time, metric, value, threshold",
+                scid=scid, metric=metric, limit=limit
+            )
             
             return [
                 {
@@ -159,8 +175,40 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error retrieving metrics: {e}")
             return []
-        finally:
-            conn.close()
+
+    def get_metric_series(
+        self,
+        scid: Optional[str] = None,
+        metric: Optional[str] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Retrieve metrics grouped into columnar series (parallel time/value arrays)"""
+        try:
+            rows = self._query_metrics(
+                "scid, metric, threshold, time, value",
+                scid=scid, metric=metric, limit=limit
+            )
+
+            # Constant fields are hoisted into the series key; rows keep time DESC order
+            series = {}
+            for r in rows:
+                key = r[:3]
+                entry = series.get(key)
+                if entry is None:
+                    entry = series[key] = {
+                        "scid": r[0],
+                        "metric": r[1],
+                        "threshold": r[2],
+                        "time": [],
+                        "value": []
+                    }
+                entry["time"].append(r[3])
+                entry["value"].append(r[4])
+
+            return list(series.values())
+        except Exception as e:
+            logger.error(f"Error retrieving metric series: {e}")
+            return []
 
     def get_metrics_count(self) -> int:
         """Get total number of metrics in database"""
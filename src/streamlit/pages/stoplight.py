@@ -2,19 +2,22 @@ import streamlit as st
 import requests
 import pandas as pd
 from utils.config import config
+from utils.series import series_to_frame
 from datetime import datetime, timedelta
 
 # Configuration
 API_URL = config["api_url"]
 
 def fetch_data():
-    """Fetch metrics from the API"""
+    """Fetch metrics from the API in columnar format and expand into a DataFrame"""
     try:
-        response = requests.get(f"{API_URL}/metrics", params={'limit': 300})
-        return response.json() if response.status_code == 200 else []
+        response = requests.get(f"{API_URL}/metrics", params={'limit': 300, 'format': 'columnar'})
+        if response.status_code != 200:
+            return pd.DataFrame()
+        return series_to_frame(response.json()['series'])
     except Exception as e:
         st.error(f"Error: {str(e)}")
-        return []
+        return pd.DataFrame()
 
 def get_stoplight_color(value, threshold):
     """Get stoplight color based on value and threshold"""
@@ -45,9 +48,8 @@ st.set_page_config(page_title="ASTRA V2 - Stoplight", page_icon="🚦", layout="
 st.title("🚦 Stoplight Status")
 
 # Fetch data
-data = fetch_data()
-if data:
-    df = pd.DataFrame(data)
+df = fetch_data()
+if not df.empty:
     df['time'] = pd.to_datetime(df['time'])
     
     # Display time range
@@ -9,27 +9,29 @@ import sys
 # Add parent directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.config import config
+from utils.series import series_to_frame
 
 # Configuration
 API_URL = config["api_url"]
 
 def fetch_data():
-    """Fetch metrics from the API"""
+    """Fetch metrics from the API in columnar format and expand into a DataFrame"""
     try:
-        response = requests.get(f"{API_URL}/metrics", params={'limit': 300})
-        return response.json() if response.status_code == 200 else []
+        response = requests.get(f"{API_URL}/metrics", params={'limit': 300, 'format': 'columnar'})
+        if response.status_code != 200:
+            return pd.DataFrame()
+        return series_to_frame(response.json()['series'])
     except Exception as e:
         st.error(f"Error: {str(e)}")
-        return []
+        return pd.DataFrame()
 
 # Page setup
 st.set_page_config(page_title="ASTRA V2 - Main", page_icon="🚀", layout="wide")
 st.title("🚀 ASTRA V2 - Main Dashboard")
 
 # Fetch data
-data = fetch_data()
-if data:
-    df = pd.DataFrame(data)
+df = fetch_data()
+if not df.empty:
     df['time'] = pd.to_datetime(df['time'])
     
     # Sidebar filters
@@ -0,0 +1,15 @@
+import pandas as pd
+
+def series_to_frame(series):
+    """Expand columnar /metrics series into one row per metric, newest first"""
+    frames = [
+        pd.DataFrame({'time': s['time'], 'value': s['value']})
+          .assign(scid=s['scid'], metric=s['metric'], threshold=s['threshold'])
+        for s in series
+    ]
+    if not frames:
+        return pd.DataFrame()
+    # Series are concatenated one after another, so restore the global time DESC order
+    # and the rows format's column order
+    df = pd.concat(frames, ignore_index=True).sort_values('time', ascending=False, kind='stable', ignore_index=True)
+    return df[['scid', 'time', 'metric', 'value', 'threshold']]
@@ -0,0 +1,124 @@
+import gzip
+import os
+import sys
+
+import orjson
+import pytest
+import zstandard
+from starlette.requests import Request
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(project_root, "src"))
+
+# The API configures a file log handler at import time
+os.makedirs(os.path.join(project_root, "logs"), exist_ok=True)
+
+from api import main
+from database.db_manager import DatabaseManager
+
+
+def make_request(accept_encoding=None):
+    headers = []
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/metrics", "headers": headers})
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    manager = DatabaseManager(str(tmp_path / "metrics.db"))
+    monkeypatch.setattr(main, "db_manager", manager)
+    return manager
+
+
+def insert(db, count, scid="1", metric="temperature", threshold=25.5):
+    for i in range(count):
+        db.insert_metric({
+            "scid": scid,
+            "time": f"2024-02-20 10:{i // 60:02d}:{i % 60:02d}",
+            "metric": metric,
+            "value": 20.0 + i,
+            "threshold": threshold
+        })
+
+
+def get_metrics(request, fmt, limit=30):
+    return main.get_metrics(request, metric=None, scid=None, limit=limit, fmt=fmt)
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("", None),
+    ("br, deflate", None),
+    ("gzip", "gzip"),
+    ("zstd", "zstd"),
+    ("gzip, deflate, zstd", "zstd"),
+    ("GZIP", "gzip"),
+    ("gzip; q=0.8", "gzip"),
+    ("gzip;q=0", None),
+    ("gzip;q=0.00, zstd;q=0.000", None),
+    ("gzip;Q=0", None),
+    ("gzip;q=abc", None),
+    ("gzip;q=1, zstd;q=0.5", "gzip"),
+    ("zstd;q=0.5, gzip;q=0.5", "zstd"),
+    ("zstd;q=0, gzip", "gzip"),
+])
+def test_negotiate_encoding(header, expected):
+    assert main.negotiate_encoding(header) == expected
+
+
+def test_columnar_response_shape(db):
+    insert(db, 2, scid="1", threshold=25.5)
+    insert(db, 1, scid="2", threshold=27.0)
+
+    response = get_metrics(make_request(), "columnar")
+
+    assert "Content-Encoding" not in response.headers
+    assert orjson.loads(response.body) == {
+        "series": [
+            {
+                "scid": "1",
+                "metric": "temperature",
+                "threshold": 25.5,
+                "time": ["2024-02-20 10:00:01", "2024-02-20 10:00:00"],
+                "value": [21.0, 20.0]
+            },
+            {
+                "scid": "2",
+                "metric": "temperature",
+                "threshold": 27.0,
+                "time": ["2024-02-20 10:00:00"],
+                "value": [20.0]
+            }
+        ]
+    }
+
+
+def test_rows_response_matches_db(db):
+    insert(db, 3)
+
+    response = get_metrics(make_request(), "rows")
+
+    assert orjson.loads(response.body) == db.get_metrics(limit=30)
+
+
+def test_small_payload_is_not_compressed(db):
+    insert(db, 1)
+
+    response = get_metrics(make_request("zstd, gzip"), "columnar")
+
+    assert len(response.body) < main.MIN_COMPRESS_SIZE
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+@pytest.mark.parametrize("header, encoding, decompress", [
+    ("zstd, gzip", "zstd", lambda body: zstandard.ZstdDecompressor().decompressobj().decompress(body)),
+    ("gzip", "gzip", gzip.decompress),
+])
+def test_large_payload_is_compressed(db, header, encoding, decompress):
+    insert(db, 100)
+
+    response = get_metrics(make_request(header), "rows", limit=100)
+
+    assert response.headers["Content-Encoding"] == encoding
+    assert orjson.loads(decompress(response.body)) == db.get_metrics(limit=100)